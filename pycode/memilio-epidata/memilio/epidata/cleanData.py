@@ -32,10 +32,151 @@ Data from following packages can be deleted:
 - getTestingData
 """
 
-import argparse
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+# files written by any of the packages
+_ALL_RE = re.compile(r'\.(json|h5|parquet|feather)$')
+
+# TODO: make general dictionary with all countries used
+_COUNTRY_DIRECTORIES = ['Germany/', 'Spain/', 'France/',
+                        'Italy/', 'US/', 'SouthKorea/', 'China/']
+
+# parts of the file names written by the different packages,
+# all of these files are stored in the folder Germany
+_GERMANY_FILE_NAMES = {
+    'cases': ["cases", "Case"],
+    'divi': ["divi", "DIVI"],
+    'vaccination': ["vacc", "Vacc"],
+    'population': ["Popul", "popul", "county_table", "reg_key", "zensus"],
+    'commuter': ["bfa", "commuter"],
+    'testing': ["testpos"],
+    'hospitalization': ["hospit", "Hospit"]}
+
+
+def _file_pattern(names, endings):
+    """! Compiles a pattern which matches file names that contain one of
+    the given names and end with one of the given endings.
+
+    @param names List of strings of which one has to be part of the file name.
+    @param endings List of file endings without leading dot, e.g. json.
+    @return Compiled regular expression.
+    """
+    return re.compile(
+        '(' + '|'.join(re.escape(name) for name in names) + ').*(' +
+        '|'.join(re.escape(ending) for ending in endings) + ')$')
+
+
+def _find_files(directory, pattern):
+    """! Lists all files in directory whose names match the pattern.
+
+    The directory is read with os.scandir such that the file type and the
+    full path of every entry are available without further system calls.
+
+    @param directory Path to the directory which is searched.
+    @param pattern Compiled regular expression the file names have to match.
+    @return List of paths of the matching files or None if the directory
+        does not exist.
+    """
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return None
+    with entries:
+        return [entry.path for entry in entries
+                if entry.is_file() and pattern.search(entry.name)]
+
+
+def _list_directories(directory):
+    """! Lists the names of all subdirectories of a directory.
+
+    @param directory Path to the directory which is searched.
+    @return Set of the names of the subdirectories. Empty if the directory
+        does not exist.
+    """
+    try:
+        entries = os.scandir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+    with entries:
+        return {entry.name for entry in entries if entry.is_dir()}
+
+
+def _find_files_in_directories(directories, pattern):
+    """! Lists all files in several directories whose names match the pattern.
+
+    @param directories List of paths to the directories which are searched.
+    @param pattern Compiled regular expression the file names have to match.
+    @return Dictionary with the existing directories as keys and the lists of
+        paths of their matching files as values.
+    """
+    found = {}
+    for directory in directories:
+        files = _find_files(directory, pattern)
+        if files is not None:
+            found[directory] = files
+    return found
+
+
+def _purge(directories, pattern, delete_directories=True):
+    """! Deletes all files in the given directories whose names match the
+    pattern.
+
+    @param directories List of paths to the directories to clean.
+    @param pattern Compiled regular expression the file names have to match.
+    @param delete_directories Defines if directories which are empty
+        afterwards are deleted as well.
+    """
+    found = _find_files_in_directories(directories, pattern)
+    _delete_files([file for files in found.values() for file in files])
+
+    if delete_directories:
+        for directory in found:
+            try:
+                os.rmdir(directory)
+            except OSError:
+                continue
+            print("Deleting directory ", directory)
 
-from memilio.epidata import defaultDict as dd
+
+def _delete_files(files):
+    """! Deletes all given files.
+
+    Deleting a file is bound by the latency of the file system rather than
+    by CPU time, so the files are removed by a pool of threads. Where the
+    platform supports it, each file is unlinked relative to a descriptor of
+    its directory, which is opened only once, such that the full path does
+    not have to be resolved again for every file.
+
+    @param files List of paths of the files to delete.
+    """
+    if not files:
+        return
+    for file in files:
+        print("Deleting file ", file)
+
+    dir_fds = {}
+    try:
+        if os.unlink in os.supports_dir_fd:
+            for directory in {os.path.dirname(file) for file in files}:
+                dir_fds[directory] = os.open(
+                    directory or os.curdir,
+                    os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+
+        def remove(file):
+            if dir_fds:
+                directory, name = os.path.split(file)
+                os.unlink(name, dir_fd=dir_fds[directory])
+            else:
+                os.remove(file)
+
+        with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+            # consume the results such that errors are raised
+            list(executor.map(remove, files))
+    finally:
+        for fd in dir_fds.values():
+            os.close(fd)
 
 
 def clean_data(
@@ -70,143 +211,40 @@ def clean_data(
     # TODO: get list from other packages which data they write.
     # Otherwise when changing anything this tool has to be changes as well
 
-    if all_data:
-
-        # TODO: make general dictionary with all countries used
-        directories = ['Germany/', 'Spain/', 'France/',
-                       'Italy/', 'US/', 'SouthKorea/', 'China/']
-
-        # delete files in directory
-        for cdir in directories:
-            directory = os.path.join(out_path, cdir)
-
-            try:
-                files = os.listdir(directory)
-            except FileNotFoundError:
-                continue
-
-            for item in files:
-                if item.endswith(".json") or item.endswith(".h5"):
-                    print("Deleting file ", os.path.join(directory, item))
-                    os.remove(os.path.join(directory, item))
-
-            # delete directories if empty
-            try:
-                os.rmdir(directory)
-            except OSError:
-                continue
-            print("Deleting directory ", directory)
+    # scan out_path only once such that missing country directories are
+    # skipped without trying to read each of them
+    present = _list_directories(out_path)
+    country_directories = [os.path.join(out_path, cdir)
+                           for cdir in _COUNTRY_DIRECTORIES
+                           if cdir.rstrip('/') in present]
 
+    if all_data:
+        _purge(country_directories, _ALL_RE)
         # delete further jh files
-        files = []
-        try:
-            files = os.listdir(out_path)
-        except FileNotFoundError:
-            pass
-
-        for item in files:
-            if item.endswith(".json") or item.endswith(".h5"):
-                print("Deleting file ", os.path.join(out_path, item))
-                os.remove(os.path.join(out_path, item))
-
-    else:
-        for ending in file_types:
-            # john hopkins data has to be removed from different directories
-            if john_hopkins:
-                # TODO: make general dictionary with all countries used
-                directories = ['Germany/', 'Spain/', 'France/',
-                               'Italy/', 'US/', 'SouthKorea/', 'China/']
-
-                # delete files in directory
-                for cdir in directories:
-                    directory = os.path.join(out_path, cdir)
-
-                    try:
-                        files = os.listdir(directory)
-                    except FileNotFoundError:
-                        continue
-
-                    for item in files:
-                        if item.endswith(ending) and "_jh" in item:
-                            print("Deleting file ",
-                                  os.path.join(directory, item))
-                            os.remove(os.path.join(directory, item))
-
-                    # delete directories
-                    try:
-                        os.rmdir(directory)
-                    except OSError:
-                        continue
-
-                    print("Deleting directory ", directory)
-
-                # delete further jh files
-                files = []
-                try:
-                    files = os.listdir(out_path)
-                except FileNotFoundError:
-                    pass
-
-                for item in files:
-                    if item.endswith(ending):
-                        if "_jh" in item or "JohnHopkins" in item:
-                            print("Deleting file ", os.path.join(out_path, item))
-                            os.remove(os.path.join(out_path, item))
-
-            # other data is stored in the same folder
-
-            directory = os.path.join(out_path, 'Germany/')
-            files = []
-            try:
-                files = os.listdir(directory)
-            except FileNotFoundError:
-                pass
-
-            filenames = []
-
-            cases_filenames = ["cases", "Case"]
-            divi_filenames = ["divi", "DIVI"]
-            vaccination_filenames = ["vacc", "Vacc"]
-            population_filenames = ["Popul", "popul",
-                                    "county_table", "reg_key", "zensus"]
-            commuter_filenames = ["bfa", 'commuter']
-            testing_filenames = ["testpos"]
-            hospitalization_filenames = ["hospit", "Hospit"]
-
-            if cases:
-                filenames += cases_filenames
-            if divi:
-                filenames += divi_filenames
-            if vaccination:
-                filenames += vaccination_filenames
-            if population:
-                filenames += population_filenames
-            if commuter:
-                filenames += commuter_filenames
-            if testing:
-                filenames += testing_filenames
-            if hospitalization:
-                filenames += hospitalization_filenames
-
-            for item in files:
-                if item.endswith(ending):
-
-                    for file in filenames:
-                        if file in item:
-                            print(
-                                "Deleting file ", os.path.join(
-                                    directory, item))
-                            os.remove(os.path.join(directory, item))
-
-                # delete directory if empty
-                try:
-                    os.rmdir(directory)
-                    print("Deleting directory ", directory)
-                except OSError:
-                    pass
-
-            if filenames == []:
-                print("Please specify what should be deleted. See --help for details.")
+        _purge([out_path], _ALL_RE, delete_directories=False)
+
+    elif file_types:
+        # john hopkins data has to be removed from different directories
+        if john_hopkins:
+            _purge(country_directories, _file_pattern(["_jh"], file_types))
+            # delete further jh files
+            _purge([out_path],
+                   _file_pattern(["_jh", "JohnHopkins"], file_types),
+                   delete_directories=False)
+
+        # other data is stored in the same folder
+        selected = {'cases': cases, 'divi': divi, 'vaccination': vaccination,
+                    'population': population, 'commuter': commuter,
+                    'testing': testing, 'hospitalization': hospitalization}
+        filenames = [name for category, names in _GERMANY_FILE_NAMES.items()
+                     if selected[category] for name in names]
+
+        if filenames:
+            if 'Germany' in present:
+                _purge([os.path.join(out_path, 'Germany/')],
+                       _file_pattern(filenames, file_types))
+        elif not john_hopkins:
+            print("Please specify what should be deleted. See --help for details.")
 
 
 def cli():
@@ -220,6 +258,11 @@ def cli():
     - choose file format: json or hdf5
     - define path to files
     """
+    # imported here such that importing this module for clean_data()
+    # does not pay for the command line only dependencies
+    import argparse
+
+    from memilio.epidata import defaultDict as dd
 
     out_path_default = dd.defaultDict['out_folder']
 
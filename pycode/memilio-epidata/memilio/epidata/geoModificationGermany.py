@@ -78,7 +78,7 @@ def get_state_names_and_ids(zfill=False):
     """
     stateids = get_state_ids(zfill=zfill)
 
-    return [[dd.State[int(stateids[i])], stateids[i]] for i in range(len(stateids))]
+    return [[dd.State[int(stateid)], stateid] for stateid in stateids]
 
 
 def get_stateid_to_name():
@@ -162,9 +162,9 @@ def get_county_names_and_ids(
     countyids = get_county_ids(merge_berlin, merge_eisenach)
 
     if zfill:
-        return [[dd.County[countyids[i]], str(countyids[i]).zfill(5)] for i in range(len(countyids))]
+        return [[dd.County[countyid], str(countyid).zfill(5)] for countyid in countyids]
     else:
-        return [[dd.County[countyids[i]], countyids[i]] for i in range(len(countyids))]
+        return [[dd.County[countyid], countyid] for countyid in countyids]
 
 
 def get_countyid_to_name():
@@ -314,8 +314,9 @@ def get_official_county_table():
     url_counties = 'http://www.destatis.de/DE/Themen/Laender-Regionen/' \
         'Regionales/Gemeindeverzeichnis/Administrativ/04-kreise.xlsx?__blob=publicationFile'
     with progress_indicator.Percentage(message="Downloading " + url_counties) as p:
-        file = gd.download_file(url_counties, 1024, None,
-                                p.set_progress, verify=False)
+        file = gd.download_file(url_counties, timeout=None,
+                                progress_function=p.set_progress,
+                                verify=False, decode_content=False)
     county_table = pd.read_excel(
         file, sheet_name=1, header=5, engine='openpyxl')
     rename_kreise_deu_dict = {
@@ -557,6 +558,7 @@ def merge_df_counties(
         separated_ids that will be used in the returned data frame.
     @param separated_ids List of old IDs that will be merged.
     @param sorting Column or criterion on how to sort the rearranged frame.
+        If empty, the rearranged frame is not sorted.
     @param columns columns to be grouped by, Default: 'Date'.
     @param method Method of merging ('sum' [default], 'mean', 'median', 'min',
         'max')
@@ -603,7 +605,8 @@ def merge_df_counties(
         df = pd.concat([df, df_merged], axis=0)
 
         # resort that final sorting is according to the date
-        df.sort_values(sorting, inplace=True)
+        if sorting:
+            df.sort_values(sorting, inplace=True)
         df.reset_index(inplace=True, drop=True)
 
     return df
@@ -625,7 +628,16 @@ def merge_df_counties_all(
         'max')
     @return Reduced data frame with IDs merged as given in CountyMerging dict.
     """
+    # sort only once after all merges instead of after every single merge
+    merged = False
     for key, val in CountyMerging.items():
-        df = merge_df_counties(df, key, val, sorting, columns, method)
+        df_new = merge_df_counties(df, key, val, [], columns, method)
+        # a new data frame is only returned if entities were merged
+        merged = merged or df_new is not df
+        df = df_new
+
+    if merged:
+        df.sort_values(sorting, inplace=True)
+        df.reset_index(inplace=True, drop=True)
 
     return df
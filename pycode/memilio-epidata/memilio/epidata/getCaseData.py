@@ -77,7 +77,8 @@ def get_case_data(read_data=dd.defaultDict['read_data'],
                   make_plot=dd.defaultDict['make_plot'],
                   split_berlin=dd.defaultDict['split_berlin'],
                   rep_date=dd.defaultDict['rep_date'],
-                  files='All'
+                  files='All',
+                  cache_dir=dd.defaultDict['cache_dir']
                   ):
     """! Downloads the case data and provides different kind of structured data
 
@@ -127,6 +128,7 @@ def get_case_data(read_data=dd.defaultDict['read_data'],
     @param split_berlin True or False. Defines if Berlin's disctricts are kept separated or get merged. Default defined in defaultDict.
     @param rep_date True or False. Defines if reporting date or reference date is taken into dataframe. Default defined in defaultDict.
     @param files List of strings or 'All' or 'Plot'. Defnies which files should be provided (and plotted). Default 'All'.
+    @param cache_dir String or None. Folder for caching downloads. Files that did not change on the server are not downloaded again. Default defined in defaultDict.
     """
 
     if files == 'All':
@@ -150,7 +152,8 @@ def get_case_data(read_data=dd.defaultDict['read_data'],
     try:
         url = "https://media.githubusercontent.com/media/robert-koch-institut/" + \
             "SARS-CoV-2-Infektionen_in_Deutschland/main/Aktuell_Deutschland_SarsCov2_Infektionen.csv"
-        df = gd.get_file(path, url, read_data, param_dict={}, interactive=True)
+        df = gd.get_file(path, url, read_data, param_dict={}, interactive=True,
+                         cache_dir=cache_dir)
         complete = check_for_completeness(df, merge_eisenach=True)
     except:
         pass
@@ -168,7 +171,8 @@ def get_case_data(read_data=dd.defaultDict['read_data'],
             # if this file is encoded with utf-8 German umlauts are not displayed correctly because they take two bytes
             # utf_8_sig can identify those bytes as one sign and display it correctly
             df = gd.get_file(path, url, False, param_dict={
-                             "encoding": 'utf_8_sig'}, interactive=True)
+                             "encoding": 'utf_8_sig'}, interactive=True,
+                             cache_dir=cache_dir)
             complete = check_for_completeness(df, merge_eisenach=True)
         except:
             pass
@@ -179,7 +183,8 @@ def get_case_data(read_data=dd.defaultDict['read_data'],
                 url = "https://npgeo-de.maps.arcgis.com/sharing/rest/content/" +\
                     "items/f10774f1c63e40168479a1feb6c7ca74/data"
                 df = gd.get_file(path, url, False, param_dict={
-                                 "encoding": 'utf_8_sig'}, interactive=True)
+                                 "encoding": 'utf_8_sig'}, interactive=True,
+                                 cache_dir=cache_dir)
                 df.rename(columns={'FID': "OBJECTID"}, inplace=True)
                 complete = check_for_completeness(df, merge_eisenach=True)
             except:
@@ -39,6 +39,11 @@ from memilio.epidata import getJHData as gjd
 pd.options.mode.copy_on_write = True
 
 
+# sheets of the RKI excel file with weekly deaths numbers used in this module
+_WEEKLY_DEATHS_SHEETS = ['COVID_Todesfälle', 'COVID_Todesfälle_KW_AG10',
+                         'COVID_Todesfälle_KW_AG20_G']
+
+
 def get_case_data_with_estimations(
         read_data=dd.defaultDict['read_data'],
         file_format=dd.defaultDict['file_format'],
@@ -50,7 +55,8 @@ def get_case_data_with_estimations(
         moving_average=dd.defaultDict['moving_average'],
         make_plot=dd.defaultDict['make_plot'],
         split_berlin=dd.defaultDict['split_berlin'],
-        rep_date=dd.defaultDict['rep_date']
+        rep_date=dd.defaultDict['rep_date'],
+        cache_dir=dd.defaultDict['cache_dir']
 ):
     """! Function to estimate recovered and deaths from combination of case data from RKI and JH data
 WARNING: This file is experimental and has not been tested.
@@ -71,6 +77,7 @@ WARNING: This file is experimental and has not been tested.
     @param make_plot True or False. Defines if plots are generated with matplotlib. Default defined in defaultDict.    
     @param split_berlin True or False. Defines if Berlin's disctricts are kept separated or get merged. Default defined in defaultDict.
     @param rep_date True or False. Defines if reporting date or reference date is taken into dataframe. Default defined in defaultDict.
+    @param cache_dir String or None. Folder for caching downloads. Files that did not change on the server are not downloaded again. Default defined in defaultDict.
     """
 
     data_path = os.path.join(out_folder, 'Germany/')
@@ -83,12 +90,12 @@ WARNING: This file is experimental and has not been tested.
         gcd.get_case_data(
             read_data, file_format, out_folder, no_raw, start_date, end_date,
             impute_dates, moving_average, make_plot_cases, split_berlin,
-            rep_date)
+            rep_date, cache_dir=cache_dir)
 
         # get data from John Hopkins University
         gjd.get_jh_data(
             read_data, file_format, out_folder, no_raw, start_date, end_date,
-            impute_dates, moving_average, make_plot_jh)
+            impute_dates, moving_average, make_plot_jh, cache_dir=cache_dir)
 
     # Now we now which data is generated and we can use it
     # read in jh data
@@ -184,17 +191,24 @@ WARNING: This file is experimental and has not been tested.
             plt.show()
 
         if file_to_change == "cases_all_germany":
+            # all sheets are taken from one download of the excel file
+            df_dict = download_weekly_deaths_numbers(
+                _WEEKLY_DEATHS_SHEETS, data_path, read_data=read_data,
+                no_raw=no_raw, cache_dir=cache_dir)
             compare_estimated_and_rki_deathsnumbers(
-                df_jh, df_cases, data_path, read_data, make_plot)
+                df_jh, df_cases, data_path, read_data, make_plot,
+                df_dict=df_dict, no_raw=no_raw)
             get_weekly_deaths_data_age_gender_resolved(
-                data_path, read_data=True)
+                data_path, read_data=read_data, df_dict=df_dict,
+                no_raw=no_raw)
             # df_cases[week] = df_cases[date].dt.isocalendar().week
     # if make_plot:
     #    plt.show()
 
 
 def compare_estimated_and_rki_deathsnumbers(
-        df_jh, df_cases, data_path, read_data, make_plot):
+        df_jh, df_cases, data_path, read_data, make_plot, df_dict=None,
+        no_raw=dd.defaultDict['no_raw']):
     """! Comparison of estimated values and monthly case values from rki
 
     From the daily number of deaths the value before is subtracted to have the actual value of the day not
@@ -210,6 +224,9 @@ def compare_estimated_and_rki_deathsnumbers(
     @param data_path Path where to store the file.
     @param read_data False or True. Defines if data is read from file or downloaded.
     @param make_plot Defines if plots are generated
+    @param df_dict Dict of dataframes returned by download_weekly_deaths_numbers
+        or None to download the weekly deaths numbers.
+    @param no_raw True or False. Defines if the downloaded sheets are not stored as json files. Default defined in defaultDict.
 
     """
     try:
@@ -246,8 +263,10 @@ def compare_estimated_and_rki_deathsnumbers(
     df_jh_week.rename(
         columns={'deaths_daily': 'Deaths_weekly'}, inplace=True)
 
-    df_dict = download_weekly_deaths_numbers(
-        sheet_names=['COVID_Todesfälle'], data_path=data_path)
+    if df_dict is None:
+        df_dict = download_weekly_deaths_numbers(
+            sheet_names=['COVID_Todesfälle'], data_path=data_path,
+            read_data=read_data, no_raw=no_raw)
 
     df_real_deaths_per_week = df_dict['COVID_Todesfälle']
     df_real_deaths_per_week.rename(
@@ -314,15 +333,21 @@ def compare_estimated_and_rki_deathsnumbers(
     # TODO: think about to add age dependent weight function
 
 
-def get_weekly_deaths_data_age_gender_resolved(data_path, read_data):
+def get_weekly_deaths_data_age_gender_resolved(
+        data_path, read_data, df_dict=None, no_raw=dd.defaultDict['no_raw']):
     """! Read case data from rki excel file
 
     @param data_path Path where to store the file.
     @param read_data False or True. Defines if data is read from file or downloaded.
+    @param df_dict Dict of dataframes returned by download_weekly_deaths_numbers
+        or None to download the weekly deaths numbers.
+    @param no_raw True or False. Defines if the downloaded sheets are not stored as json files. Default defined in defaultDict.
     """
 
-    df_dict = download_weekly_deaths_numbers(sheet_names=[
-                                             'COVID_Todesfälle_KW_AG10', 'COVID_Todesfälle_KW_AG20_G'], data_path=data_path)
+    if df_dict is None:
+        df_dict = download_weekly_deaths_numbers(sheet_names=[
+                                                 'COVID_Todesfälle_KW_AG10', 'COVID_Todesfälle_KW_AG20_G'], data_path=data_path,
+                                                 read_data=read_data, no_raw=no_raw)
 
     df_real_deaths_per_week_age = df_dict['COVID_Todesfälle_KW_AG10']
     df_real_deaths_per_week_gender = df_dict['COVID_Todesfälle_KW_AG20_G']
@@ -377,10 +402,23 @@ def get_weekly_deaths_data_age_gender_resolved(data_path, read_data):
         'cases_weekly_deaths_gender_resolved', 'json')
 
 
-def download_weekly_deaths_numbers(sheet_names, data_path):
+def download_weekly_deaths_numbers(
+        sheet_names, data_path, read_data=False,
+        no_raw=dd.defaultDict['no_raw'],
+        cache_dir=dd.defaultDict['cache_dir']):
     """!Downloads excel file from RKI webpage
+
+    All sheets used by this module are parsed from one download, such that
+    they can be stored together.
+
     @param sheet_names List. Sheet names to be returned.
     @param data_path Path where to store the file.
+    @param read_data False or True. Defines if the sheets are read from the
+        json files written by a previous download. If one of the files does
+        not exist, the excel file is downloaded.
+    @param no_raw True or False. Defines if the downloaded sheets are not
+        stored as json files. Default defined in defaultDict.
+    @param cache_dir String or None. Folder for caching downloads. Files that did not change on the server are not downloaded again. Default defined in defaultDict.
 
     @return dict of dataframes with sheetnames as keys.
     """
@@ -389,13 +427,32 @@ def download_weekly_deaths_numbers(sheet_names, data_path):
     url = "https://www.rki.de/DE/Content/InfAZ/N/Neuartiges_Coronavirus/Projekte_RKI/" \
           "COVID-19_Todesfaelle.xlsx?__blob=publicationFile"
 
+    if read_data:
+        try:
+            return {
+                sheet_name: pd.read_json(os.path.join(
+                    data_path, name_file + '_' + sheet_name + '.json'))
+                for sheet_name in sheet_names}
+        except FileNotFoundError:
+            pass
+
     # Either download excel file from url or read json file from filepath.
     # Since sheet_names is a list of names get file returns a dict
     # with sheet_names as keys and their corresponding dataframes as values.
+    all_sheet_names = list(dict.fromkeys(
+        list(sheet_names) + _WEEKLY_DEATHS_SHEETS))
     df_dict = gd.get_file(filepath=data_path + name_file + '.json', url=url, read_data=False,
-                          param_dict={'sheet_name': sheet_names, 'header': 0, 'engine': 'openpyxl'})
+                          param_dict={'sheet_name': all_sheet_names, 'header': 0, 'engine': 'openpyxl'},
+                          cache_dir=cache_dir)
+
+    # store the sheets such that the excel file does not have to be
+    # downloaded and parsed again
+    if not no_raw:
+        for sheet_name, df in df_dict.items():
+            gd.write_dataframe(
+                df, data_path, name_file + '_' + sheet_name, 'json')
 
-    return df_dict
+    return {sheet_name: df_dict[sheet_name] for sheet_name in sheet_names}
 
 
 def main():
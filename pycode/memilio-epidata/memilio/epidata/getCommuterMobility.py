@@ -102,10 +102,10 @@ def assign_geographical_entities(countykey_list, govkey_list):
     # a global key to local (in gov region) key ordering
     countykey2govkey = collections.OrderedDict()
     countykey2localnumlist = collections.OrderedDict()
-    for i in range(len(gov_county_table)):
-        for j in range(len(gov_county_table[i])):
-            countykey2govkey[gov_county_table[i][j]] = i
-            countykey2localnumlist[gov_county_table[i][j]] = j
+    for i, gov_counties in enumerate(gov_county_table):
+        for j, county_key in enumerate(gov_counties):
+            countykey2govkey[county_key] = i
+            countykey2localnumlist[county_key] = j
 
     # create government regions list per state
     state_gov_table = []
@@ -135,7 +135,8 @@ def get_commuter_data(read_data=dd.defaultDict['read_data'],
                       no_raw=dd.defaultDict['no_raw'],
                       make_plot=dd.defaultDict['make_plot'],
                       setup_dict='',
-                      ref_year=2022):
+                      ref_year=2022,
+                      cache_dir=dd.defaultDict['cache_dir']):
     """! Computes DataFrame of commuter migration patterns based on the Federal
     Agency of Work data.
 
@@ -152,6 +153,7 @@ def get_commuter_data(read_data=dd.defaultDict['read_data'],
         'rel_tol': relative Tolerance to undetected people
     @param ref_year Year between 2013 and 2022 that specifies where the data should be taken from.
         Default value is 2022.
+    @param cache_dir String or None. Folder for caching downloads. Files that did not change on the server are not downloaded again. Default defined in defaultDict.
     @return df_commuter_migration DataFrame of commuter migration.
         df_commuter_migration[i][j]= number of commuters from county with county-id i to county with county-id j
     In commuter migration files is a cumulative value per county for number of commuters from whole Germany given.
@@ -195,7 +197,8 @@ def get_commuter_data(read_data=dd.defaultDict['read_data'],
             states[state_id_file] + '_' + str(ref_year)
         filepath = os.path.join(mobility_dir) + filename + '.json'
         commuter_migration_files[state_id_file] = gd.get_file(
-            filepath, url, read_data, param_dict, interactive=True)
+            filepath, url, read_data, param_dict, interactive=True,
+            cache_dir=cache_dir)
         if not no_raw:
             gd.write_dataframe(
                 commuter_migration_files[state_id_file], mobility_dir, filename, 'json')
@@ -471,10 +474,10 @@ def get_commuter_data(read_data=dd.defaultDict['read_data'],
                                                                     new_idx] + mat_commuter_migration[:, old_idx]
         mat_commuter_migration[new_idx, new_idx] = 0
 
-        mat_commuter_migration = np.delete(
-            mat_commuter_migration, old_idx, axis=0)
-        mat_commuter_migration = np.delete(
-            mat_commuter_migration, old_idx, axis=1)
+        # remove row and column of the merged county with a single copy
+        keep = np.ones(mat_commuter_migration.shape[0], dtype=bool)
+        keep[old_idx] = False
+        mat_commuter_migration = mat_commuter_migration[np.ix_(keep, keep)]
 
     countykey_list = geoger.get_county_ids()
     df_commuter_migration = pd.DataFrame(
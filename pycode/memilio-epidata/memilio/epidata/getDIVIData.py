@@ -57,7 +57,8 @@ def get_divi_data(read_data=dd.defaultDict['read_data'],
                   end_date=dd.defaultDict['end_date'],
                   impute_dates=dd.defaultDict['impute_dates'],
                   moving_average=dd.defaultDict['moving_average'],
-                  make_plot=dd.defaultDict['make_plot']
+                  make_plot=dd.defaultDict['make_plot'],
+                  cache_dir=dd.defaultDict['cache_dir']
                   ):
     """! Downloads or reads the DIVI ICU data and writes them in different files.
 
@@ -84,6 +85,7 @@ def get_divi_data(read_data=dd.defaultDict['read_data'],
     @param moving_average Integers >=0. Applies an 'moving_average'-days moving average on all time series
         to smooth out effects of irregular reporting. Default defined in defaultDict.
     @param make_plot [Currently not used] True or False. Defines if plots are generated with matplotlib. Default defined in defaultDict.
+    @param cache_dir String or None. Folder for caching downloads. Files that did not change on the server are not downloaded again. Default defined in defaultDict.
     """
 
     # First csv data on 24-04-2020
@@ -101,7 +103,8 @@ def get_divi_data(read_data=dd.defaultDict['read_data'],
         "Intensivkapazitaeten_und_COVID-19-Intensivbettenbelegung_in_Deutschland/"\
         "main/Intensivregister_Landkreise_Kapazitaeten.csv"
     path = os.path.join(directory + filename + ".json")
-    df_raw = gd.get_file(path, url, read_data, param_dict={}, interactive=True)
+    df_raw = gd.get_file(path, url, read_data, param_dict={}, interactive=True,
+                         cache_dir=cache_dir)
 
     if not df_raw.empty:
         if not no_raw:
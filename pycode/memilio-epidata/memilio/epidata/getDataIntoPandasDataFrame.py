@@ -32,6 +32,11 @@ This tool contains
 import os
 import argparse
 import datetime
+import hashlib
+import importlib.util
+import json
+import shutil
+import tempfile
 import requests
 import magic
 import urllib3
@@ -39,14 +44,39 @@ from io import BytesIO
 from zipfile import ZipFile
 from warnings import warn
 
+import numpy as np
 import pandas as pd
 
 from memilio.epidata import defaultDict as dd
 from memilio.epidata import progress_indicator
 
+# pandas only loads the excel engine on the first call of read_excel, load it
+# here such that the first download does not pay for it; set the environment
+# variable MEMILIO_LAZY_IMPORTS to skip this (e.g. for faster test discovery)
+if not os.environ.get('MEMILIO_LAZY_IMPORTS'):
+    try:
+        import openpyxl  # noqa: F401
+    except ImportError:
+        pass
+
 # activate CoW for more predictable behaviour of pandas DataFrames
 pd.options.mode.copy_on_write = True
 
+# output formats written with the optional dependency pyarrow, which is only
+# looked up here instead of being imported
+_COLUMNAR_FORMATS = ['parquet', 'feather']
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+# downloads larger than this number of bytes are spooled to disk
+_SPOOL_MAX_SIZE = 32 * 1024 * 1024
+
+# session shared by all downloads such that connections are kept alive and
+# reused instead of opening a new connection for every file
+_SESSION = requests.Session()
+for _prefix in ['http://', 'https://']:
+    _SESSION.mount(_prefix, requests.adapters.HTTPAdapter(
+        pool_connections=16, pool_maxsize=32))
+
 
 def user_choice(message, default=False):
     while True:
@@ -59,9 +89,21 @@ def user_choice(message, default=False):
             print("Please answer with y (yes) or n (no)")
 
 
+def _cache_paths(cache_dir, url):
+    """! Returns the paths of the cached content and meta data of an url.
+
+    @param cache_dir Directory of the download cache.
+    @param url Full url of the cached file.
+    @return Paths of the content and of the meta data file.
+    """
+    key = hashlib.sha1(url.encode()).hexdigest()
+    return (os.path.join(cache_dir, key + '.bin'),
+            os.path.join(cache_dir, key + '.meta.json'))
+
+
 def download_file(
-        url, chunk_size=1024, timeout=None, progress_function=None,
-        verify=True):
+        url, chunk_size=65536, timeout=None, progress_function=None,
+        verify=True, cache_dir=None, decode_content=True):
     """! Download a file using GET over HTTP.
 
     @param url Full url of the file to download.
@@ -71,23 +113,49 @@ def download_file(
         Can be set to None to let the server decide the chunk size (may be
         equal to the file size).
     @param timeout Timeout in seconds for the GET request.
-    @param progress_function Function called regularly, with the current
-        download progress in [0,1] as a float argument.
+    @param progress_function Function called whenever the download progress
+        advanced by at least one percent, with the current download progress
+        in [0,1] as a float argument.
     @param verify bool or "interactive". If False, ignores the connection's
         security. If True, only starts downloads from secure connections, and
         insecure connections raise a FileNotFoundError. If "interactive",
         prompts the user whether or not to allow insecure connections.
-    @return File as BytesIO
+    @param cache_dir Directory of a download cache or None to not cache.
+        If given, the file is stored with its ETag and Last-Modified header
+        and only downloaded again if it was changed on the server.
+    @param decode_content bool. If False, the server is asked to send the file
+        without content encoding and the bytes are read as they arrive,
+        without decompressing them. Useful for files that are already
+        compressed, like xlsx or zip files.
+    @return File like object with the content of the file. Files larger
+        than a few MB are spooled to a temporary file on disk instead of being
+        held in memory.
     """
     if verify not in [True, False, "interactive"]:
         warn('Invalid input for argument verify. Expected True, False, or'
              ' "interactive", got ' + str(verify) + '.'
              ' Proceeding with "verify=True".', category=RuntimeWarning)
         verify = True
+    headers = {}
+    if not decode_content:
+        headers['Accept-Encoding'] = 'identity'
+    if cache_dir is not None:
+        cache_file, cache_meta = _cache_paths(cache_dir, url)
+        try:
+            with open(cache_meta) as meta_file:
+                meta = json.load(meta_file)
+        except (FileNotFoundError, ValueError):
+            meta = {}
+        # conditional GET, the server answers 304 if the file did not change
+        if os.path.isfile(cache_file):
+            if meta.get('ETag'):
+                headers['If-None-Match'] = meta['ETag']
+            if meta.get('Last-Modified'):
+                headers['If-Modified-Since'] = meta['Last-Modified']
     # send GET request as stream so the content is not downloaded at once
     try:
-        req = requests.get(
-            url, stream=True, timeout=timeout,
+        req = _SESSION.get(
+            url, stream=True, timeout=timeout, headers=headers,
             verify=verify in [True, "interactive"])
     except OSError:
         if verify == "interactive" and user_choice(
@@ -95,10 +163,21 @@ def download_file(
             " could not be opened due to an insecure connection. "
                 "Do you want to open it anyways?\n"):
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            req = requests.get(url, stream=True, timeout=timeout, verify=False)
+            req = _SESSION.get(url, stream=True, timeout=timeout,
+                               headers=headers, verify=False)
         else:
             raise FileNotFoundError(
                 "Error: URL " + url + " could not be opened.")
+    if req.status_code == 304 and (
+            'If-None-Match' in headers or 'If-Modified-Since' in headers):
+        # not modified, use cached file
+        if progress_function:
+            progress_function(1)
+        file = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+        with open(cache_file, 'rb') as cached:
+            shutil.copyfileobj(cached, file)
+        file.seek(0)
+        return file
     if req.status_code != 200:  # e.g. 404
         raise requests.exceptions.HTTPError("HTTPError: "+str(req.status_code))
     # get file size from http header
@@ -106,21 +185,48 @@ def download_file(
     # may be larger (e.g. when 'content-encoding' is gzip; decoding is handled
     # by iter_content)
     file_size = int(req.headers.get('content-length'))
-    file = bytearray()  # file to be downloaded
+    # write the chunks directly into the file like object that is returned,
+    # such that the downloaded content is not reallocated and copied again;
+    # large files (e.g. zip archives) are moved to disk to limit memory usage
+    file = tempfile.SpooledTemporaryFile(
+        max_size=_SPOOL_MAX_SIZE)  # file to be downloaded
+
+    def chunks(chunk_size):
+        if decode_content:
+            # download file as bytes via iter_content
+            return req.iter_content(
+                chunk_size=chunk_size, decode_unicode=False)
+        # read the bytes as they are sent, without any decoding
+        return req.raw.stream(chunk_size or 65536, decode_content=False)
     if progress_function:
         progress = 0
-        # download file as bytes via iter_content
-        for chunk in req.iter_content(chunk_size=chunk_size):
-            file += chunk  # append chunk to file
+        last_percent = -1
+        for chunk in chunks(chunk_size):
+            file.write(chunk)  # append chunk to file
             # note: len(chunk) may be larger (e.g. encoding)
             # or smaller (for the last chunk) than chunk_size
-            progress = min(progress+chunk_size, file_size)
-            progress_function(progress/file_size)
+            progress = min(progress+len(chunk), file_size)
+            # only report progress if the displayed percentage changes
+            percent = progress * 100 // file_size
+            if percent != last_percent:
+                last_percent = percent
+                progress_function(progress/file_size)
     else:  # download without tracking progress
-        for chunk in req.iter_content(chunk_size=None):
-            file += chunk  # append chunk to file
+        for chunk in chunks(None):
+            file.write(chunk)  # append chunk to file
+    if cache_dir is not None:
+        meta = {key: req.headers[key] for key in ['ETag', 'Last-Modified']
+                if key in req.headers}
+        if meta:
+            os.makedirs(cache_dir, exist_ok=True)
+            file.seek(0)
+            with open(cache_file, 'wb') as cached:
+                shutil.copyfileobj(file, cached)
+            with open(cache_meta, 'w') as meta_file:
+                json.dump(meta, meta_file)
     # return the downloaded content as file like object
-    return BytesIO(file)
+    file.seek(0)
+    return file
 
 
 def extract_zip(file, **param_dict):
@@ -134,13 +240,16 @@ def extract_zip(file, **param_dict):
     """
     with ZipFile(file, 'r') as zipObj:
         names = zipObj.namelist()
-        all_dfs = [[] for i in range(len(names))]
-        for i in range(len(names)):
-            with zipObj.open(names[i]) as file2:
+        all_dfs = []
+        for name in names:
+            with zipObj.open(name) as file2:
                 try:
-                    all_dfs[i] = pd.read_excel(file2.read(), **param_dict)
+                    # wrap the decompressed member instead of passing bytes,
+                    # which is deprecated for read_excel
+                    all_dfs.append(
+                        pd.read_excel(BytesIO(file2.read()), **param_dict))
                 except:
-                    pass
+                    all_dfs.append([])
     if len(all_dfs) == 1:
         all_dfs = all_dfs[0]
     return all_dfs
@@ -148,8 +257,8 @@ def extract_zip(file, **param_dict):
 
 def get_file(
         filepath='', url='', read_data=dd.defaultDict['read_data'],
-        param_dict={},
-        interactive=False):
+        param_dict=None,
+        interactive=False, cache_dir=dd.defaultDict['cache_dir']):
     """! Loads data from filepath and stores it in a pandas dataframe.
     If data can't be read from given filepath the user is asked whether the file should be downloaded from the given url or not.
     Uses the progress indicator to give feedback.
@@ -157,11 +266,15 @@ def get_file(
     @param filepath String. Filepath from where the data is read.
     @param url String. URL to download the dataset.
     @param read_data True or False. Defines if item is opened from directory (True) or downloaded (False).
-    @param param_dct Dict. Additional information for download functions (e.g. engine, sheet_name, header...)
+    @param param_dict Dict or None. Additional information for download functions (e.g. engine, sheet_name, header...)
     @param interactive bool. Whether to ask for user input. If False, raises Errors instead.
+    @param cache_dir String or None. Directory of the download cache, see download_file.
 
     @return pandas dataframe
     """
+    if param_dict is None:
+        param_dict = {}
+
     param_dict_excel = {"sheet_name": 0, "header": 0, "engine": 'openpyxl'}
     param_dict_csv = {"sep": ',', "header": 0, "encoding": None, 'dtype': None}
     param_dict_zip = {}
@@ -183,7 +296,8 @@ def get_file(
                 " does not exist in the directory. Do you want to download "
                     "the file from " + url + " instead?\n"):
                 df = get_file(filepath=filepath, url=url,
-                              read_data=False, param_dict={})
+                              read_data=False, param_dict={},
+                              cache_dir=cache_dir)
             else:
                 error_message = "Error: The file from " + filepath + \
                     " does not exist. Call program without -r flag to get it."
@@ -192,8 +306,10 @@ def get_file(
         try:  # to download file from url and show download progress
             with progress_indicator.Percentage(message="Downloading " + url) as p:
                 file = download_file(
-                    url, 1024, None, p.set_progress,
-                    verify="interactive" if interactive else True)
+                    url, timeout=None,
+                    progress_function=p.set_progress,
+                    verify="interactive" if interactive else True,
+                    cache_dir=cache_dir)
                 # read first 2048 bytes to find file type
                 ftype = magic.from_buffer(file.read(2048))
                 # set pointer back to starting position
@@ -202,12 +318,10 @@ def get_file(
                 func_to_use = [
                     val for key, val in filetype_dict.items()
                     if key in ftype]
-                # use different default dict for different functions
-                dict_to_use = param_dict_dict[func_to_use[0]]
-                # adjust dict
-                for k in dict_to_use:
-                    if k not in param_dict:
-                        param_dict[k] = dict_to_use[k]
+                # use different default dict for different functions,
+                # given parameters overwrite the defaults
+                param_dict = {
+                    **param_dict_dict[func_to_use[0]], **param_dict}
                 # create dataframe
                 df = func_to_use[0](file, **param_dict)
         except OSError:
@@ -226,6 +340,112 @@ def get_file(
     return df
 
 
+# TODO: may it would be easier to make a dict like the following one together with a function to get key:
+# TODO: all should automatically do everything
+# cli_dict2 = {"end_date": ['divi'],
+#                "plot": ['cases'],
+#                "start_date": ['divi']                 }
+
+_CLI_DICT = {"divi": ['Downloads data from DIVI', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot', 'cache_dir'],
+             "cases": ['Download case data from RKI', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot', 'split_berlin', 'rep_date', 'cache_dir'],
+             "cases_est": ['Download case data from RKI and JHU and estimate recovered and deaths', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot', 'split_berlin', 'rep_date', 'cache_dir'],
+             "population": ['Download population data from official sources', 'username'],
+             "commuter_official": ['Download commuter data from official sources', 'make_plot', 'cache_dir'],
+             "vaccination": ['Download vaccination data', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot', 'sanitize_data', 'cache_dir'],
+             "testing": ['Download testing data', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot'],
+             "jh": ['Downloads data from Johns Hopkins University', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot', 'cache_dir'],
+             "hospitalization": ['Download hospitalization data', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot', 'cache_dir'],
+             "sim": ['Download all data needed for simulations', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot', 'split_berlin', 'rep_date', 'sanitize_data', 'cache_dir']}
+
+# start dates of the data sources that differ from the default start date
+_START_DATE_DEFAULTS = {'divi': datetime.date(2020, 4, 24),
+                        'jh': datetime.date(2020, 1, 22)}
+
+
+def _parse_iso_date(date_string):
+    """! Parses a date of the form YYYY-mm-dd without the overhead of strptime.
+
+    As with strptime, month and day can be given without leading zeros,
+    e.g. 2020-4-1.
+
+    @param date_string String of the form YYYY-mm-dd.
+    @return datetime.date
+    """
+    parts = date_string.split('-')
+    if (len(parts) != 3 or len(parts[0]) != 4
+            or not all(0 < len(part) <= 2 for part in parts[1:])
+            or not all(part.isdigit() for part in parts)):
+        raise ValueError(
+            "Date " + date_string + " does not have the form YYYY-mm-dd.")
+    return datetime.date(*map(int, parts))
+
+
+def _add_credentials(parser):
+    """! Adds the command line arguments for username and password.
+
+    The credentials are needed to download data from official sources like
+    regionalstatistik.de. If they are not given, they are read from a config
+    file or requested interactively by the download function.
+    The arguments are added after all other arguments, such that they are
+    listed at the end of the help message.
+
+    @param parser argparse.ArgumentParser the arguments are added to.
+    """
+    parser.add_argument(
+        '--username', type=str
+    )
+
+    parser.add_argument(
+        '--password', type=str
+    )
+
+
+# functions adding the package specific command line arguments to the parser,
+# the credentials are added by _add_credentials after all other arguments
+_CLI_OPTIONS = {
+    'start_date': lambda parser, what: parser.add_argument(
+        '-s', '--start-date',
+        default=_START_DATE_DEFAULTS.get(what, dd.defaultDict['start_date']),
+        help='Defines start date for data download. Should have form: YYYY-mm-dd.'
+        'Default is ' +
+        str(dd.defaultDict['start_date']) +
+        ' (2020-04-24 for divi and 2020-01-22 for jh)',
+        type=_parse_iso_date),
+    'end_date': lambda parser, what: parser.add_argument(
+        '-e', '--end-date', default=dd.defaultDict['end_date'],
+        help='Defines date after which data download is stopped.'
+        'Should have form: YYYY-mm-dd. Default is today',
+        type=_parse_iso_date),
+    'impute_dates': lambda parser, what: parser.add_argument(
+        '-i', '--impute-dates', default=dd.defaultDict['impute_dates'],
+        help='the resulting dfs contain all dates instead of'
+        ' omitting dates where no data was reported', action='store_true'),
+    'moving_average': lambda parser, what: parser.add_argument(
+        '-m', '--moving-average', type=int, default=dd.defaultDict['moving_average'],
+        help='Compute a moving average of N days over the time series. Default is ' + str(dd.defaultDict['moving_average'])),
+    'make_plot': lambda parser, what: parser.add_argument(
+        '-p', '--make-plot', default=dd.defaultDict['make_plot'], help='Plots the data.',
+        action='store_true'),
+    'split_berlin': lambda parser, what: parser.add_argument(
+        '-b', '--split-berlin', default=dd.defaultDict['split_berlin'],
+        help='Berlin data is split into different counties,'
+        ' instead of having only one county for Berlin.',
+        action='store_true'),
+    'rep_date': lambda parser, what: parser.add_argument(
+        '--rep-date', default=dd.defaultDict['rep_date'],
+        help='If reporting date is activated, the reporting date'
+        'will be prefered over possibly given dates of disease onset.',
+        action='store_true'),
+    'sanitize_data': lambda parser, what: parser.add_argument(
+        '-sd', '--sanitize_data', type=int, default=dd.defaultDict['sanitize_data'],
+        help='Redistributes cases of every county either based on regions ratios or on thresholds and population'),
+    'cache_dir': lambda parser, what: parser.add_argument(
+        '--cache-dir', type=str, default=dd.defaultDict['cache_dir'],
+        help='Defines folder for caching downloads. Files that did not '
+        'change on the server are read from there instead of downloading '
+        'them again. Population data is not cached. Default is no caching.')}
+
+
 def cli(what):
     """! Defines command line interface
 
@@ -238,7 +458,7 @@ def cli(what):
 
     The following default arguments are added to the parser:
     - read-from-disk
-    - file-format, choices = ['json', 'hdf5', 'json_timeasstring']
+    - file-format, choices = ['json', 'hdf5', 'json_timeasstring', 'parquet', 'feather']
     - out_path
     - no_raw
     - no_progress_indicators (excluded from dict)
@@ -253,29 +473,13 @@ def cli(what):
     - split_berlin
     - rep_date
     - sanitize_data
+    - cache_dir
 
     @param what Defines what packages calls and thus what kind of command line arguments should be defined.
     """
 
-    # TODO: may it would be easier to make a dict like the following one together with a function to get key:
-    # TODO: all should automatically do everything
-    # cli_dict2 = {"end_date": ['divi'],
-    #                "plot": ['cases'],
-    #                "start_date": ['divi']                 }
-
-    cli_dict = {"divi": ['Downloads data from DIVI', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot'],
-                "cases": ['Download case data from RKI', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot', 'split_berlin', 'rep_date'],
-                "cases_est": ['Download case data from RKI and JHU and estimate recovered and deaths', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot', 'split_berlin', 'rep_date'],
-                "population": ['Download population data from official sources', 'username'],
-                "commuter_official": ['Download commuter data from official sources', 'make_plot'],
-                "vaccination": ['Download vaccination data', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot', 'sanitize_data'],
-                "testing": ['Download testing data', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot'],
-                "jh": ['Downloads data from Johns Hopkins University', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot'],
-                "hospitalization": ['Download hospitalization data', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot'],
-                "sim": ['Download all data needed for simulations', 'start_date', 'end_date', 'impute_dates', 'moving_average', 'make_plot', 'split_berlin', 'rep_date', 'sanitize_data']}
-
     try:
-        what_list = cli_dict[what]
+        what_list = _CLI_DICT[what]
     except KeyError:
         raise ValueError("Wrong key or cli_dict.")
 
@@ -294,7 +498,7 @@ def cli(what):
     parser.add_argument(
         '-f', '--file-format', type=str, default=dd.defaultDict
         ['file_format'],
-        choices=['json', 'hdf5', 'json_timeasstring'],
+        choices=['json', 'hdf5', 'json_timeasstring', 'parquet', 'feather'],
         help='Defines output format for data files. Default is \"' +
         str(dd.defaultDict['file_format'] + "\"."))
     parser.add_argument('-o', '--out-folder', type=str,
@@ -305,55 +509,9 @@ def cli(what):
         help='Defines if raw data will be stored for further use.',
         action='store_true')
 
-    if 'start_date' in what_list:
-        if what == 'divi':
-            start_date_default = datetime.date(2020, 4, 24)
-        elif what == 'jh':
-            start_date_default = datetime.date(2020, 1, 22)
-        else:
-            start_date_default = dd.defaultDict['start_date']
-        parser.add_argument(
-            '-s', '--start-date', default=start_date_default,
-            help='Defines start date for data download. Should have form: YYYY-mm-dd.'
-            'Default is ' +
-            str(dd.defaultDict['start_date']) +
-            ' (2020-04-24 for divi and 2020-01-22 for jh)',
-            type=lambda s: datetime.datetime.strptime(s, '%Y-%m-%d').date())
-    if 'end_date' in what_list:
-        parser.add_argument(
-            '-e', '--end-date', default=dd.defaultDict['end_date'],
-            help='Defines date after which data download is stopped.'
-            'Should have form: YYYY-mm-dd. Default is today',
-            type=lambda s: datetime.datetime.strptime(s, '%Y-%m-%d').date())
-    if 'impute_dates' in what_list:
-        parser.add_argument(
-            '-i', '--impute-dates', default=dd.defaultDict['impute_dates'],
-            help='the resulting dfs contain all dates instead of'
-            ' omitting dates where no data was reported', action='store_true')
-    if 'moving_average' in what_list:
-        parser.add_argument(
-            '-m', '--moving-average', type=int, default=dd.defaultDict['moving_average'],
-            help='Compute a moving average of N days over the time series. Default is ' + str(dd.defaultDict['moving_average']))
-    if 'make_plot' in what_list:
-        parser.add_argument('-p', '--make-plot', default=dd.defaultDict['make_plot'], help='Plots the data.',
-                            action='store_true')
-    if 'split_berlin' in what_list:
-        parser.add_argument(
-            '-b', '--split-berlin', default=dd.defaultDict['split_berlin'],
-            help='Berlin data is split into different counties,'
-            ' instead of having only one county for Berlin.',
-            action='store_true')
-    if 'rep_date' in what_list:
-        parser.add_argument(
-            '--rep-date', default=dd.defaultDict['rep_date'],
-            help='If reporting date is activated, the reporting date'
-            'will be prefered over possibly given dates of disease onset.',
-            action='store_true')
-    if 'sanitize_data' in what_list:
-        parser.add_argument(
-            '-sd', '--sanitize_data', type=int, default=dd.defaultDict['sanitize_data'],
-            help='Redistributes cases of every county either based on regions ratios or on thresholds and population'
-        )
+    for option in what_list[1:]:
+        if option != 'username':
+            _CLI_OPTIONS[option](parser, what)
 
     parser.add_argument(
         '--no-progress-indicators',
@@ -361,14 +519,14 @@ def cli(what):
         action='store_true')
 
     if 'username' in what_list:
-        parser.add_argument(
-            '--username', type=str
-        )
+        _add_credentials(parser)
 
-        parser.add_argument(
-            '--password', type=str
-        )
     args = vars(parser.parse_args())
+    # fail before downloading anything if the output can not be written
+    try:
+        _check_file_format(args["file_format"])
+    except ImportError as error:
+        parser.error(str(error))
     # disable progress indicators globally, if the argument --no-progress-indicators was specified
     progress_indicator.ProgressIndicator.disable_indicators(
         args["no_progress_indicators"])
@@ -407,12 +565,26 @@ def check_dir(directory):
     @param directory directory which should exist
     """
 
-    # check if directory exists or create it
-    if not os.path.exists(directory):
-        os.makedirs(directory)
+    # create directory if it does not exist, without a separate check that
+    # could race with concurrent calls
+    os.makedirs(directory, exist_ok=True)
+
+
+def _check_file_format(file_format):
+    """! Checks if the packages needed to write a file format are installed
+
+    The columnar formats parquet and feather are written with the optional
+    dependency pyarrow.
+
+    @param file_format file format (string)
+    """
+    if file_format in _COLUMNAR_FORMATS and not _HAS_PYARROW:
+        raise ImportError(
+            "Error: The file format " + file_format + " requires pyarrow. "
+            "Install it with: pip install memilio-epidata[columnar]")
 
 
-def write_dataframe(df, directory, file_prefix, file_type, param_dict={}):
+def write_dataframe(df, directory, file_prefix, file_type, param_dict=None):
     """! Writes pandas dataframe to file
 
     This routine writes a pandas dataframe to a file in a given format.
@@ -423,15 +595,20 @@ def write_dataframe(df, directory, file_prefix, file_type, param_dict={}):
     - hdf5
     - csv
     - txt
+    - parquet
+    - feather
     The file_type defines the file format and thus also the file ending.
-    The file format can be json, hdf5, csv or txt.
+    The file format can be json, hdf5, csv, txt, parquet or feather.
     For this option the column Date is converted from datetime to string.
+    The columnar formats parquet and feather require pyarrow
+    (pip install memilio-epidata[columnar]), otherwise an ImportError is
+    raised.
 
     @param df pandas dataframe (pandas DataFrame)
     @param directory directory where to safe (string)
     @param file_prefix filename without ending (string)
     @param file_type defines ending (string)
-    @param param_dict defines parameters for to_csv/txt(dictionary)
+    @param param_dict defines parameters for to_csv/txt(dictionary or None)
 
     """
 
@@ -439,7 +616,9 @@ def write_dataframe(df, directory, file_prefix, file_type, param_dict={}):
                'json_timeasstring': [".json", {"orient": "records"}],
                'hdf5': [".h5", {"key": "data"}],
                'csv': [".csv", {}],
-               'txt': [".txt", param_dict]}
+               'txt': [".txt", param_dict if param_dict is not None else {}],
+               'parquet': [".parquet", {"compression": "zstd"}],
+               'feather': [".feather", {"compression": "lz4"}]}
 
     try:
         outFormEnd = outForm[file_type][0]
@@ -447,16 +626,26 @@ def write_dataframe(df, directory, file_prefix, file_type, param_dict={}):
     except KeyError:
         raise ValueError(
             "Error: The file format: " + file_type +
-            " does not exist. Use json, json_timeasstring, hdf5, csv or txt.")
+            " does not exist. Use json, json_timeasstring, hdf5, csv, txt, "
+            "parquet or feather.")
+    _check_file_format(file_type)
 
     out_path = os.path.join(directory, file_prefix + outFormEnd)
 
     if file_type == "json":
         df.to_json(out_path, **outFormSpec)
     elif file_type == "json_timeasstring":
-        if dd.EngEng['date'] in df.columns:
-            if not isinstance(df.Date.values[0], str):
-                df.Date = df.Date.dt.strftime('%Y-%m-%d')
+        date_col = dd.EngEng['date']
+        if date_col in df.columns:
+            if pd.api.types.is_datetime64_dtype(df[date_col]):
+                # convert in numpy instead of formatting every single date
+                dates = df[date_col].values
+                date_strings = dates.astype(
+                    'datetime64[D]').astype(str).astype(object)
+                date_strings[np.isnat(dates)] = np.nan
+                df[date_col] = date_strings
+            elif len(df) > 0 and not isinstance(df[date_col].values[0], str):
+                df[date_col] = df[date_col].dt.strftime('%Y-%m-%d')
         df.to_json(out_path, **outFormSpec)
     elif file_type == "hdf5":
         df.to_hdf(out_path, **outFormSpec)
@@ -464,6 +653,10 @@ def write_dataframe(df, directory, file_prefix, file_type, param_dict={}):
         df.to_csv(out_path)
     elif file_type == "txt":
         df.to_csv(out_path, **outFormSpec)
+    elif file_type == "parquet":
+        df.to_parquet(out_path, **outFormSpec)
+    elif file_type == "feather":
+        df.to_feather(out_path, **outFormSpec)
 
     print("Information: Data has been written to", out_path)
 
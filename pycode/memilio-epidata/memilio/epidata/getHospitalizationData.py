@@ -141,7 +141,8 @@ def get_hospitalization_data(read_data=dd.defaultDict['read_data'],
                              end_date=dd.defaultDict['end_date'],
                              impute_dates=dd.defaultDict['impute_dates'],
                              moving_average=dd.defaultDict['moving_average'],
-                             make_plot=dd.defaultDict['make_plot']
+                             make_plot=dd.defaultDict['make_plot'],
+                             cache_dir=dd.defaultDict['cache_dir']
                              ):
     """! Downloads or reads the RKI hospitalization data and writes them in different files.
 
@@ -168,6 +169,7 @@ def get_hospitalization_data(read_data=dd.defaultDict['read_data'],
     @param moving_average [Currently not used] Integers >=0. Applies an 'moving_average'-days moving average on all time series
         to smooth out weekend effects.  Default defined in defaultDict.
     @param make_plot [currently not used] True or False. Defines if plots are generated with matplotlib. Default defined in defaultDict.
+    @param cache_dir String or None. Folder for caching downloads. Files that did not change on the server are not downloaded again. Default defined in defaultDict.
     """
     impute_dates = True
     directory = os.path.join(out_folder, 'Germany/')
@@ -177,7 +179,8 @@ def get_hospitalization_data(read_data=dd.defaultDict['read_data'],
     filename = "RKIHospitFull"
     url = "https://raw.githubusercontent.com/robert-koch-institut/COVID-19-Hospitalisierungen_in_Deutschland/master/Aktuell_Deutschland_COVID-19-Hospitalisierungen.csv"
     path = os.path.join(directory + filename + ".json")
-    df_raw = gd.get_file(path, url, read_data, param_dict={}, interactive=True)
+    df_raw = gd.get_file(path, url, read_data, param_dict={}, interactive=True,
+                         cache_dir=cache_dir)
 
     hospit_sanity_checks(df_raw)
 
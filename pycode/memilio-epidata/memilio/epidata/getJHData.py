@@ -44,7 +44,8 @@ def get_jh_data(read_data=dd.defaultDict['read_data'],
                 end_date=dd.defaultDict['end_date'],
                 impute_dates=dd.defaultDict['impute_dates'],
                 moving_average=dd.defaultDict['moving_average'],
-                make_plot=dd.defaultDict['make_plot']):
+                make_plot=dd.defaultDict['make_plot'],
+                cache_dir=dd.defaultDict['cache_dir']):
     """! Download data from John Hopkins University
 
    Data is either downloaded and afterwards stored or loaded from a stored filed.
@@ -68,6 +69,7 @@ def get_jh_data(read_data=dd.defaultDict['read_data'],
     @param moving_average [Currently not used] Integers >=0. Applies an 'moving_average'-days moving average on all time series
         to smooth out effects of irregular reporting. Default defined in defaultDict.
     @param make_plot [Currently not used] True or False. Defines if plots are generated with matplotlib. Default defined in defaultDict.
+    @param cache_dir String or None. Folder for caching downloads. Files that did not change on the server are not downloaded again. Default defined in defaultDict.
    """
     if start_date < date(2020, 1, 22):
         print("Warning: First data available on 2020-01-22. "
@@ -78,7 +80,8 @@ def get_jh_data(read_data=dd.defaultDict['read_data'],
     filename = "FullData_JohnHopkins"
     url = "https://raw.githubusercontent.com/datasets/covid-19/master/data/time-series-19-covid-combined.csv"
     path = os.path.join(out_folder, filename + ".json")
-    df = gd.get_file(path, url, read_data, param_dict={}, interactive=True)
+    df = gd.get_file(path, url, read_data, param_dict={}, interactive=True,
+                     cache_dir=cache_dir)
 
     if not no_raw:
         gd.write_dataframe(df, out_folder, filename, "json")
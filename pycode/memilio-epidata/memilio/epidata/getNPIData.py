@@ -66,8 +66,9 @@ def validate(df_npis_old, df_npis, df_infec_rki, countyID, npiCode,
             npiCodes))].iloc[:, :list(df_npis_old.columns).index(end_date_validation.strftime('d%Y%m%d'))+1]
     dummy_old = np.zeros(
         (dummy_old_rows.shape[1]-start_npi_cols, dummy_old_rows.shape[0]))
+    dummy_old_values = dummy_old_rows.values
     for i in range(dummy_old.shape[1]):
-        dummy_old[:, i] = dummy_old_rows.values[i][start_npi_cols:]
+        dummy_old[:, i] = dummy_old_values[i][start_npi_cols:]
 
     dummy_new = df_npis.loc[(df_npis[dd.EngEng['idCounty']] == countyID) & (
         df_npis[dd.EngEng['date']] <= end_date_validation), npiCodes[0]].values
@@ -633,9 +634,9 @@ def get_npi_data(fine_resolution=2,
         df_npis_combinations = {
             npi_groups_combinations_unique[i]:
             [
-                {df_npis_combinations_pre['Variablenname'][npi_groups_idx[i]].values[j]:
-                 df_npis_combinations_pre['Massnahmenindex'][npi_groups_idx[i]].values[j] for j in range(
-                    len(df_npis_combinations_pre['Variablenname'][npi_groups_idx[i]]))},
+                dict(zip(
+                    df_npis_combinations_pre['Variablenname'][npi_groups_idx[i]].values,
+                    df_npis_combinations_pre['Massnahmenindex'][npi_groups_idx[i]].values)),
                 np.eye(len(npi_groups_idx[i]))]
             for i in range(len(npi_groups_combinations_unique))}
 
@@ -1391,8 +1392,7 @@ def plot_interaction_matrix(filename, directory):
     @param[in] directory Directory where to read and save data.
     """
     target_directory = os.path.join(directory, 'heatmaps_' + filename)
-    if not os.path.exists(target_directory):
-        os.makedirs(target_directory)
+    os.makedirs(target_directory, exist_ok=True)
 
     try:
         codelist = pd.ExcelFile(os.path.join(
@@ -157,33 +157,16 @@ def export_population_dataframe(df_pop, directory, file_format, merge_eisenach):
         '<3 years', '3-5 years', '6-14 years', '15-17 years',
         '18-24 years', '25-29 years', '30-39 years', '40-49 years',
         '50-64 years', '65-74 years', '>74 years']
+    # start indices of the (17) age groups of df_pop that are summed up to
+    # <3, 3-5, 6-14, 15-17, 18-24, 25-29, 30-39, 40-49, 50-64, 65-74, >74
+    age_group_starts = [0, 1, 2, 4, 5, 7, 8, 10, 12, 15, 16]
+    pop_age_groups = df_pop[df_pop.columns[2:19]].values
+
     df_pop_export = pd.DataFrame(columns=new_cols)
     df_pop_export[new_cols[0]] = df_pop[dd.EngEng['idCounty']]
-    # <3 and 3-5
-    df_pop_export[new_cols[2:4]] = df_pop[df_pop.columns[2:4]]
-    # 6-14
-    df_pop_export[new_cols[4]] = \
-        df_pop[df_pop.columns[4:6]].sum(axis=1)
-    # 15-17
-    df_pop_export[new_cols[5]] = df_pop[df_pop.columns[6]]
-    # 18-24
-    df_pop_export[new_cols[6]] = \
-        df_pop[df_pop.columns[7:9]].sum(axis=1)
-    # 25-29
-    df_pop_export[new_cols[7]] = df_pop[df_pop.columns[9]]
-    # 30-39
-    df_pop_export[new_cols[8]] = \
-        df_pop[df_pop.columns[10:12]].sum(axis=1)
-    # 40-49
-    df_pop_export[new_cols[9]] = \
-        df_pop[df_pop.columns[12:14]].sum(axis=1)
-    # 50-64
-    df_pop_export[new_cols[10]] = \
-        df_pop[df_pop.columns[14:17]].sum(axis=1)
-    # 65-74
-    df_pop_export[new_cols[11]] = df_pop[df_pop.columns[17]]
-    # >74
-    df_pop_export[new_cols[12]] = df_pop[df_pop.columns[18]]
+    # sum up all new age groups in one operation
+    df_pop_export[new_cols[2:]] = np.add.reduceat(
+        pop_age_groups, age_group_starts, axis=1)
 
     df_pop_export[dd.EngEng['population']
                   ] = df_pop_export.iloc[:, 2:].sum(axis=1)
@@ -239,34 +222,44 @@ def assign_population_data(df_pop_raw, counties, age_cols, idCounty_idx):
 
     df_pop = pd.DataFrame(new_cols)
 
+    # check the IDs of all entities in the raw data at once
+    county_ids = df_pop_raw.loc[idCounty_idx, dd.EngEng['idCounty']].values
+    is_county = np.isin(county_ids, counties[:, 1])
+    # Berlin and Hamburg are listed with their state ID only
+    is_city_state = np.isin(county_ids + '000', counties[:, 1])
+
+    # IDs of the counties in the new DataFrame and indexes in the old
+    # DataFrame where the corresponding data starts
+    assigned_ids = []
+    assigned_idx = []
+
+    # materialize the population numbers only once instead of slicing the
+    # DataFrame for every entity
+    numbers = df_pop_raw[dd.EngEng['number']].values
+
     empty_data = ['.', '-']
-    for start_idx in idCounty_idx:
+    for i, start_idx in enumerate(idCounty_idx):
 
-        county_id = df_pop_raw.loc[start_idx, dd.EngEng['idCounty']]
+        county_id = county_ids[i]
+        county_numbers = numbers[start_idx: start_idx + num_age_groups]
 
         # check for empty rows
-        if df_pop_raw.loc[start_idx: start_idx + num_age_groups - 1,
-                          dd.EngEng['number']].values.any() in empty_data:
-            if not df_pop_raw.loc[start_idx: start_idx + num_age_groups - 1,
-                                  dd.EngEng['number']].values.all() in empty_data:
+        if county_numbers.any() in empty_data:
+            if not county_numbers.all() in empty_data:
                 raise gd.DataError(
                     'Error. Partially incomplete data for county ' +
                     county_id)
 
         # county information needed
-        elif county_id in counties[:, 1]:
+        elif is_county[i]:
             # direct assignment of population data found
-            df_pop.loc[df_pop[dd.EngEng['idCounty']] == df_pop_raw.loc
-                       [start_idx, dd.EngEng['idCounty']],
-                       age_cols] = df_pop_raw.loc[start_idx: start_idx + num_age_groups - 1, dd.EngEng
-                                                  ['number']].values.astype(int)
+            assigned_ids.append(county_id)
+            assigned_idx.append(start_idx)
         # Berlin and Hamburg
-        elif county_id + '000' in counties[:, 1]:
+        elif is_city_state[i]:
             # direct assignment of population data found
-            df_pop.loc[df_pop[dd.EngEng['idCounty']] == df_pop_raw.loc
-                       [start_idx, dd.EngEng['idCounty']] + '000',
-                       age_cols] = df_pop_raw.loc[start_idx: start_idx + num_age_groups - 1, dd.EngEng
-                                                  ['number']].values.astype(int)
+            assigned_ids.append(county_id + '000')
+            assigned_idx.append(start_idx)
 
         # additional information for local entities not needed
         elif county_id in ['03241001', '05334002', '10041100']:
@@ -275,12 +268,18 @@ def assign_population_data(df_pop_raw, counties, age_cols, idCounty_idx):
         elif len(county_id) < 5:
             pass
         else:
-            print('no data for ' + df_pop_raw.loc
-                  [start_idx, dd.EngEng['idCounty']])
+            print('no data for ' + county_id)
             raise gd.DataError(
                 'Error. County ID in input population data '
                 'found which could not be assigned.')
 
+    # assign data of all counties at once by joining on the county IDs
+    # instead of searching the county of every entity in the new DataFrame
+    rows = pd.Index(df_pop[dd.EngEng['idCounty']]).get_indexer(assigned_ids)
+    df_pop.loc[rows, age_cols] = numbers[np.add.outer(
+        np.asarray(assigned_idx, dtype=int),
+        np.arange(num_age_groups))].astype(int)
+
     return df_pop
 
 
@@ -54,7 +54,8 @@ def get_simulation_data(read_data=dd.defaultDict['read_data'],
                         make_plot=dd.defaultDict['make_plot'],
                         split_berlin=dd.defaultDict['split_berlin'],
                         rep_date=dd.defaultDict['rep_date'],
-                        sanitize_data=dd.defaultDict['sanitize_data']
+                        sanitize_data=dd.defaultDict['sanitize_data'],
+                        cache_dir=dd.defaultDict['cache_dir']
                         ):
     """! Downloads all data from external sources
 
@@ -78,6 +79,7 @@ def get_simulation_data(read_data=dd.defaultDict['read_data'],
     @param split_berlin True or False. Defines if Berlin's disctricts are kept separated or get merged. Default defined in defaultDict.
     @param rep_date True or False. Defines if reporting date or reference date is taken into dataframe. Default defined in defaultDict.
     @param sanitize_data Value in {0,1,2,3}. Redistributes cases of every county either based on regions' ratios or on thresholds and population.
+    @param cache_dir String or None. Folder for caching downloads of case, DIVI and vaccination data. Files that did not change on the server are not downloaded again. Default defined in defaultDict.
     """
 
     arg_dict_all = {
@@ -86,7 +88,7 @@ def get_simulation_data(read_data=dd.defaultDict['read_data'],
 
     arg_dict_data_download = {"start_date": start_date, "end_date": end_date,
                               "impute_dates": impute_dates, "moving_average": moving_average,
-                              "make_plot": make_plot}
+                              "make_plot": make_plot, "cache_dir": cache_dir}
 
     arg_dict_cases = {**arg_dict_all, **arg_dict_data_download,
                       "split_berlin": split_berlin, "rep_date": rep_date}
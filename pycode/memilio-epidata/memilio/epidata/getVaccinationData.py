@@ -37,12 +37,15 @@ from memilio.epidata import modifyDataframeSeries as mdfs
 pd.options.mode.copy_on_write = True
 
 
-def download_vaccination_data(read_data, filename, directory):
+def download_vaccination_data(
+        read_data, filename, directory,
+        cache_dir=dd.defaultDict['cache_dir']):
 
     url = "https://raw.githubusercontent.com/robert-koch-institut/COVID-19-Impfungen_in_Deutschland/master/Deutschland_Landkreise_COVID-19-Impfungen.csv"
     path = os.path.join(directory + filename + ".json")
     df_data = gd.get_file(path, url, read_data, param_dict={'dtype': {
-        'LandkreisId_Impfort': "string", 'Altersgruppe': "string", 'Impfschutz': int, 'Anzahl': int}}, interactive=True)
+        'LandkreisId_Impfort': "string", 'Altersgruppe': "string", 'Impfschutz': int, 'Anzahl': int}}, interactive=True,
+        cache_dir=cache_dir)
 
     return df_data
 
@@ -398,13 +401,21 @@ def extrapolate_age_groups_vaccinations(
     groupby_list = list(df_data.columns)
     for i in range(len(column_names)):
         groupby_list.remove(column_names[i])
+    # hash map from county ID to its population in all age groups, ordered
+    # as in min_all_ages, to avoid searching the population data per county
+    population_unique = population_all_ages.drop_duplicates(
+        subset=dd.EngEng['idCounty'])
+    county_to_pop_all_ages = dict(zip(
+        population_unique[dd.EngEng['idCounty']],
+        population_unique[[str(age) for age in min_all_ages]].values.astype(
+            float)))
     # extrapolate age groups for one county at a time
     for countyID in df_data[dd.EngEng['idCounty']].unique():
 
         # get copy of global dataframe with only entries for current county
         vacc_df = df_data[df_data[dd.EngEng['idCounty']] == countyID]
         # get population data for all age groups in current county
-        pop_state = population_all_ages[population_all_ages[dd.EngEng['idCounty']] == countyID]
+        pop_county = county_to_pop_all_ages[countyID]
         # create empty dataframe for each county
         total_county_df = []
 
@@ -417,26 +428,25 @@ def extrapolate_age_groups_vaccinations(
             info_df = county_age_df.drop(
                 column_names, axis=1).drop(
                 dd.EngEng['ageRKI'], axis=1)
-            # create new dataframe for vaccination data
-            vacc_data_df = []
-
             # get total population in old agegroup
             total_pop = 0
             for j in age_old_to_all_ages_indices[i]:
-                total_pop += float(pop_state[str(min_all_ages[j])].iloc[0])
+                total_pop += pop_county[j]
             # get population ratios in old agegroup
             ratios = [0 for zz in range(0, len(unique_age_groups_new))]
             for j in age_old_to_all_ages_indices[i]:
                 ratios[all_ages_to_age_new_share[j][0][1]
-                       ] += float(pop_state[str(min_all_ages[j])].iloc[0])/total_pop
-            # split vaccinations in old agegroup to new agegroups
-            for j in range(0, len(ratios)):
-                new_dataframe = county_age_df[column_names]*ratios[j]
-                new_dataframe[dd.EngEng['ageRKI']] = unique_age_groups_new[j]
-                vacc_data_df.append(pd.concat(
-                    [info_df, new_dataframe],
-                    axis=1))
-            vacc_data_df = pd.concat(vacc_data_df)
+                       ] += pop_county[j]/total_pop
+            # split vaccinations in old agegroup to new agegroups with one
+            # broadcast multiplication for all new agegroups
+            vacc_data = np.multiply.outer(
+                ratios, county_age_df[column_names].values)
+            # create new dataframe for vaccination data
+            vacc_data_df = pd.concat(len(ratios) * [info_df])
+            vacc_data_df[column_names] = vacc_data.reshape(
+                -1, len(column_names))
+            vacc_data_df[dd.EngEng['ageRKI']] = np.repeat(
+                unique_age_groups_new, len(county_age_df))
 
             # merge all dataframes for each age group into one dataframe
             total_county_df.append(vacc_data_df)
@@ -470,7 +480,8 @@ def get_vaccination_data(read_data=dd.defaultDict['read_data'],
                          impute_dates=True,
                          moving_average=dd.defaultDict['moving_average'],
                          make_plot=dd.defaultDict['make_plot'],
-                         sanitize_data=dd.defaultDict['sanitize_data']
+                         sanitize_data=dd.defaultDict['sanitize_data'],
+                         cache_dir=dd.defaultDict['cache_dir']
                          ):
     """! Downloads the RKI vaccination data and provides different kind of structured data.
 
@@ -520,6 +531,7 @@ def get_vaccination_data(read_data=dd.defaultDict['read_data'],
         The sanitizing threshold will be defined by the age group-specific
         average on the corresponding vaccination ratios on county and federal
         state level.  
+    @param cache_dir String or None. Folder for caching downloads. Files that did not change on the server are not downloaded again. Default defined in defaultDict.
     """
     # data for all dates is automatically added
     if impute_dates == False:
@@ -531,7 +543,8 @@ def get_vaccination_data(read_data=dd.defaultDict['read_data'],
 
     filename = "RKIVaccFull"
 
-    df_data = download_vaccination_data(read_data, filename, directory)
+    df_data = download_vaccination_data(
+        read_data, filename, directory, cache_dir=cache_dir)
 
     if not no_raw:
         gd.write_dataframe(df_data, directory, filename, "json")
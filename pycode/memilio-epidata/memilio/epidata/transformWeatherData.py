@@ -141,14 +141,11 @@ def transformWeatherData(read_data=dd.defaultDict['read_data'],
             # create columns for date, county ID and NPI code
             df_local_new = pd.DataFrame(columns=df_weather.columns)
 
-            # access weather values matrix and store it as floats
-            weather_vals = df_local_old.iloc[:,
-                                             start_weather_cols+col_old_vars[0]].astype(float).values
-            for i in range(1, len(col_old_vars)):
-                # add new rows
-                weather_vals = np.append(
-                    weather_vals, df_local_old.iloc[:,
-                                                    start_weather_cols + col_old_vars[i]].astype(float).values, axis=0)
+            # access weather values matrix and store it as floats, the rows
+            # of all features are stacked into one array at once
+            weather_vals = np.concatenate(
+                [df_local_old.iloc[:, start_weather_cols + col_old_var].astype(
+                    float).values for col_old_var in col_old_vars], axis=0)
 
             # fill in NPI values by transposing from columns to rows
             df_local_new[dd.EngEng['date']] = dates_new
@@ -458,6 +458,11 @@ class TestGetCaseDatawithEstimations(fake_filesystem_unittest.TestCase):
             moving_average=moving_average, make_plot=make_plot,
             split_berlin=split_berlin, rep_date=rep_date)
 
+        # the weekly deaths numbers are downloaded only once
+        mock_download_weekly_deaths_numbers.assert_called_once_with(
+            gcdwe._WEEKLY_DEATHS_SHEETS, directory, read_data=read_data,
+            no_raw=no_raw, cache_dir=dd.defaultDict['cache_dir'])
+
         # check if expected files are written
         self.assertEqual(len(os.listdir(self.path)), 1)
         self.assertEqual(
@@ -540,6 +545,65 @@ class TestGetCaseDatawithEstimations(fake_filesystem_unittest.TestCase):
             [deaths_estimated].item(),
             np.round(43 * 2. / 9.))
 
+    @patch('memilio.epidata.getCaseDatawithEstimations.gd.get_file',
+           return_value=df_dict)
+    def test_download_weekly_deaths_numbers(self, mock_get_file):
+
+        directory = os.path.join(self.path, 'Germany/')
+        gd.check_dir(directory)
+        sheet_names = list(self.df_dict.keys())
+
+        # without raw data, the sheets are not stored
+        gcdwe.download_weekly_deaths_numbers(
+            sheet_names[:1], directory, read_data=True, no_raw=True)
+        self.assertEqual(mock_get_file.call_count, 1)
+        self.assertEqual(os.listdir(directory), [])
+
+        # no stored sheets available, excel file has to be downloaded;
+        # all sheets are parsed and stored, even if only one is requested
+        df_dict = gcdwe.download_weekly_deaths_numbers(
+            sheet_names[:1], directory, read_data=True)
+        self.assertEqual(mock_get_file.call_count, 2)
+        self.assertEqual(
+            mock_get_file.call_args.kwargs['param_dict']['sheet_name'],
+            gcdwe._WEEKLY_DEATHS_SHEETS)
+        self.assertEqual(list(df_dict.keys()), sheet_names[:1])
+        for sheet_name in sheet_names:
+            self.assertIn(
+                'Cases_deaths_weekly_' + sheet_name + '.json',
+                os.listdir(directory))
+
+        # stored sheets are read instead of downloading them again
+        df_dict = gcdwe.download_weekly_deaths_numbers(
+            sheet_names, directory, read_data=True)
+        self.assertEqual(mock_get_file.call_count, 2)
+        for sheet_name in sheet_names:
+            pd.testing.assert_frame_equal(
+                df_dict[sheet_name], self.df_dict[sheet_name],
+                check_dtype=False)
+
+        # without read_data, the excel file is always downloaded
+        gcdwe.download_weekly_deaths_numbers(
+            sheet_names, directory, read_data=False)
+        self.assertEqual(mock_get_file.call_count, 3)
+
+    @patch('memilio.epidata.getCaseDatawithEstimations.gd.get_file')
+    def test_weekly_deaths_no_raw(self, mock_get_file):
+
+        mock_get_file.side_effect = lambda *args, **kwargs: {
+            sheet_name: df.copy() for sheet_name, df in self.df_dict.items()}
+        directory = os.path.join(self.path, 'Germany/')
+        gd.check_dir(directory)
+
+        # without raw data, only the processed sheets are written
+        gcdwe.get_weekly_deaths_data_age_gender_resolved(
+            directory, read_data=False, no_raw=True)
+        self.assertEqual(mock_get_file.call_count, 1)
+        self.assertEqual(
+            sorted(os.listdir(directory)),
+            ['cases_weekly_deaths_age_resolved.json',
+             'cases_weekly_deaths_gender_resolved.json'])
+
     @patch('builtins.print')
     def test_except_non_existing_file(self, mock_print):
 
@@ -20,6 +20,7 @@
 import os
 import json
 import sys
+import tempfile
 from datetime import date, datetime
 from io import StringIO
 import unittest
@@ -367,6 +368,27 @@ class Test_getDataIntoPandasDataFrame(fake_filesystem_unittest.TestCase):
             assert impute_dates == dd.defaultDict['impute_dates']
             assert no_raw == False
 
+        # month and day can be given without leading zeros
+        test_args = ["prog", '--start-date', '2020-4-1', '--end-date',
+                     '2020-11-26']
+
+        with patch.object(sys, 'argv', test_args):
+            arg_dict = gd.cli("jh")
+            assert arg_dict["start_date"] == date(2020, 4, 1)
+            assert arg_dict["end_date"] == date(2020, 11, 26)
+
+        test_args = ["prog", '--cache-dir', 'some_cache']
+
+        with patch.object(sys, 'argv', test_args):
+            for what in ['cases', 'cases_est', 'divi', 'jh', 'hospitalization',
+                         'vaccination', 'commuter_official', 'sim']:
+                arg_dict = gd.cli(what)
+                assert arg_dict["cache_dir"] == 'some_cache'
+
+        with patch.object(sys, 'argv', ["prog"]):
+            arg_dict = gd.cli("divi")
+            assert arg_dict["cache_dir"] == dd.defaultDict['cache_dir']
+
     def test_append_filename(self):
         test_moving_average = 2
         test_impute_dates = True
@@ -458,6 +480,89 @@ class Test_getDataIntoPandasDataFrame(fake_filesystem_unittest.TestCase):
         # self.assertEqual(len(os.listdir(self.path)), 3)
         # self.assertEqual(os.listdir(self.path), [file])
 
+    def test_write_dataframe_json(self):
+
+        gd.check_dir(self.path)
+
+        # floats are rounded to ten decimal places, non-ASCII characters
+        # and slashes are escaped and duplicate column names raise an error
+        df = pd.DataFrame({'County': ['Lüneburg', None],
+                           'Share': [0.1 + 0.2, float('nan')],
+                           'Incidence': [12.3456789012345, 1e-12],
+                           'Source': ['RKI/DIVI', 'RKI']})
+        gd.write_dataframe(df, self.path, "test_json", 'json')
+        with open(os.path.join(self.path, "test_json.json")) as f:
+            self.assertEqual(
+                f.read(),
+                '[{"County":"L\\u00fcneburg","Share":0.3,'
+                '"Incidence":12.3456789012,"Source":"RKI\\/DIVI"},'
+                '{"County":null,"Share":null,"Incidence":0.0,'
+                '"Source":"RKI"}]')
+
+        df = pd.DataFrame([[1, 2]], columns=['a', 'a'])
+        with self.assertRaises(ValueError):
+            gd.write_dataframe(df, self.path, "test_json", 'json')
+
+    @patch('memilio.epidata.getDataIntoPandasDataFrame._HAS_PYARROW', True)
+    @patch('pandas.DataFrame.to_feather')
+    @patch('pandas.DataFrame.to_parquet')
+    def test_write_dataframe_columnar(self, mock_parquet, mock_feather):
+
+        gd.check_dir(self.path)
+
+        df = pd.DataFrame(data={'col1': [1, 2], 'col2': ["d1", "d2"]})
+
+        gd.write_dataframe(df, self.path, "test_parquet", 'parquet')
+        mock_parquet.assert_called_once_with(
+            os.path.join(self.path, "test_parquet.parquet"),
+            compression="zstd")
+
+        gd.write_dataframe(df, self.path, "test_feather", 'feather')
+        mock_feather.assert_called_once_with(
+            os.path.join(self.path, "test_feather.feather"),
+            compression="lz4")
+
+    @unittest.skipUnless(gd._HAS_PYARROW, "pyarrow is not installed")
+    def test_write_dataframe_columnar_round_trip(self):
+
+        df = pd.DataFrame(data={
+            'ID_County': [1001, 1002], 'County': ["SK Flensburg", None],
+            'Date': pd.to_datetime(["2020-11-26", "2020-07-26"]),
+            'Confirmed': [0.5, float('nan')]})
+
+        # pyarrow writes with its own file system, which is not faked
+        self.pause()
+        try:
+            with tempfile.TemporaryDirectory() as directory:
+                gd.write_dataframe(df, directory, "test_parquet", 'parquet')
+                pd.testing.assert_frame_equal(pd.read_parquet(
+                    os.path.join(directory, "test_parquet.parquet")), df)
+                gd.write_dataframe(df, directory, "test_feather", 'feather')
+                pd.testing.assert_frame_equal(pd.read_feather(
+                    os.path.join(directory, "test_feather.feather")), df)
+        finally:
+            self.resume()
+
+    @patch('memilio.epidata.getDataIntoPandasDataFrame._HAS_PYARROW', False)
+    @patch('sys.stderr', new_callable=StringIO)
+    def test_columnar_without_pyarrow(self, mock_stderr):
+
+        gd.check_dir(self.path)
+        df = pd.DataFrame(data={'col1': [1, 2], 'col2': ["d1", "d2"]})
+
+        for file_format in ['parquet', 'feather']:
+            with self.assertRaises(ImportError) as error:
+                gd.write_dataframe(df, self.path, "test", file_format)
+            self.assertIn("requires pyarrow", str(error.exception))
+
+            # the cli fails before anything is downloaded
+            with patch.object(sys, 'argv',
+                              ["prog", '--file-format', file_format]):
+                with self.assertRaises(SystemExit):
+                    gd.cli("cases")
+            self.assertIn("requires pyarrow", mock_stderr.getvalue())
+        self.assertEqual(os.listdir(self.path), [])
+
     def test_write_dataframe_error(self):
 
         gd.check_dir(self.path)
@@ -474,7 +579,8 @@ class Test_getDataIntoPandasDataFrame(fake_filesystem_unittest.TestCase):
             gd.write_dataframe(df, self.path, "test_json", 'wrong')
 
         error_message = "Error: The file format: " + 'wrong' + \
-                        " does not exist. Use json, json_timeasstring, hdf5, csv or txt."
+                        " does not exist. Use json, json_timeasstring, hdf5, csv, txt, " \
+                        "parquet or feather."
         self.assertEqual(str(error.exception), error_message)
 
     @patch('memilio.epidata.getDIVIData.get_divi_data')
@@ -520,6 +626,11 @@ class Test_getDataIntoPandasDataFrame(fake_filesystem_unittest.TestCase):
         # change start-date of jh to 2020-01-22
         arg_dict_jh["start_date"] = date(2020, 1, 22)
 
+        # all downloads except population data can be cached
+        for arg_dict in [arg_dict_cases, arg_dict_divi, arg_dict_jh,
+                         arg_dict_vaccination, arg_dict_cases_est]:
+            arg_dict["cache_dir"] = dd.defaultDict['cache_dir']
+
         arg_dict_popul = {**arg_dict_all, "username": None, "password": None}
 
         getVaccinationData.main()
@@ -581,7 +692,7 @@ class Test_getDataIntoPandasDataFrame(fake_filesystem_unittest.TestCase):
         error_message = "Error: Dataframe is empty."
         self.assertEqual(str(error.exception), error_message)
 
-    @patch('requests.get')
+    @patch('memilio.epidata.getDataIntoPandasDataFrame._SESSION.get')
     @patch('builtins.input')
     @patch('pandas.read_json')
     def test_get_file_user_input(self, mock_json, mock_in, mock_request):
@@ -616,6 +727,71 @@ class Test_getDataIntoPandasDataFrame(fake_filesystem_unittest.TestCase):
         # check call count
         self.assertEqual(mock_in.call_count, 2)
 
+    @patch('memilio.epidata.getDataIntoPandasDataFrame._SESSION.get')
+    def test_download_file(self, mock_request):
+
+        chunks = [b'{"a": ', b'1, "b": ', b'2}']
+        mock_request.return_value.status_code = 200
+        mock_request.return_value.headers = {
+            'content-length': str(sum(len(chunk) for chunk in chunks))}
+        mock_request.return_value.iter_content.side_effect = \
+            lambda **kwargs: iter(chunks)
+
+        # download without tracking progress
+        file = gd.download_file('test_url.com')
+        self.assertEqual(file.read(), b'{"a": 1, "b": 2}')
+
+        # download with tracking progress
+        progress = []
+        file = gd.download_file(
+            'test_url.com', chunk_size=6, progress_function=progress.append)
+        self.assertEqual(file.read(), b'{"a": 1, "b": 2}')
+        self.assertEqual(progress[-1], 1)
+
+        # progress is only reported if the percentage changes
+        chunks = 1000 * [b'a']
+        mock_request.return_value.headers = {'content-length': '1000'}
+        progress = []
+        file = gd.download_file(
+            'test_url.com', chunk_size=1, progress_function=progress.append)
+        self.assertEqual(file.read(), 1000 * b'a')
+        self.assertEqual(len(progress), 101)
+        self.assertEqual(progress[-1], 1)
+
+        # download raw bytes without content encoding
+        mock_request.return_value.raw.stream.return_value = iter([b'a', b'b'])
+        file = gd.download_file('test_url.com', decode_content=False)
+        self.assertEqual(file.read(), b'ab')
+        self.assertEqual(mock_request.call_args.kwargs['headers'],
+                         {'Accept-Encoding': 'identity'})
+
+    @patch('memilio.epidata.getDataIntoPandasDataFrame._SESSION.get')
+    def test_download_file_cache(self, mock_request):
+
+        cache_dir = os.path.join(self.path, 'cache')
+        mock_request.return_value.status_code = 200
+        mock_request.return_value.headers = {
+            'content-length': '8', 'ETag': '"abc"'}
+        mock_request.return_value.iter_content.side_effect = \
+            lambda **kwargs: iter([b'a,b\n1,2\n'])
+
+        # first download is stored in the cache
+        file = gd.download_file('test_url.com', cache_dir=cache_dir)
+        self.assertEqual(file.read(), b'a,b\n1,2\n')
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+        self.assertEqual(mock_request.call_args.kwargs['headers'], {})
+
+        # unchanged file is read from the cache
+        mock_request.return_value.status_code = 304
+        file = gd.download_file('test_url.com', cache_dir=cache_dir)
+        self.assertEqual(file.read(), b'a,b\n1,2\n')
+        self.assertEqual(mock_request.call_args.kwargs['headers'],
+                         {'If-None-Match': '"abc"'})
+
+        # the cached file is read through get_file as well
+        file = gd.get_file(url='test_url.com', cache_dir=cache_dir)
+        pd.testing.assert_frame_equal(file, pd.DataFrame({'a': [1], 'b': [2]}))
+
 
 if __name__ == '__main__':
     unittest.main()
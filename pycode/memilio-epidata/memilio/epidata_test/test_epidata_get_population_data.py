@@ -21,11 +21,13 @@ import os
 import unittest
 import configparser
 import json
+import numpy as np
 import pandas as pd
 
 from unittest.mock import patch
 from pyfakefs import fake_filesystem_unittest
 
+from memilio.epidata import defaultDict as dd
 from memilio.epidata import getPopulationData as gpd
 from memilio.epidata import progress_indicator
 
@@ -78,6 +80,36 @@ class Test_getPopulationData(fake_filesystem_unittest.TestCase):
             df = gpd.read_population_data(
                 username='', password='', read_data=True, directory=directory)
 
+    def test_assign_population_data(self):
+
+        counties = np.array([['SK Flensburg', '01001'], ['Berlin', '11000'],
+                             ['SK Kiel', '01002']])
+        age_cols = np.array(['0-4', '5-99'], dtype=object)
+        df_pop_raw = pd.DataFrame({
+            dd.EngEng['idCounty']: ['01', '01', '01001', '01001', '11', '11',
+                                    '01002', '01002'],
+            dd.EngEng['number']: ['5', '6', '1', '2', '3', '4', '.', '.']})
+
+        # states are skipped, Berlin is assigned by its state ID and
+        # counties with empty data keep zero population
+        df_pop = gpd.assign_population_data(
+            df_pop_raw, counties, age_cols, [0, 2, 4, 6])
+        self.assertListEqual(list(df_pop['0-4']), [1, 3, 0])
+        self.assertListEqual(list(df_pop['5-99']), [2, 4, 0])
+
+        # no county in raw data
+        df_pop = gpd.assign_population_data(
+            df_pop_raw[:2], counties, age_cols, [0])
+        self.assertListEqual(list(df_pop[dd.EngEng['idCounty']]),
+                             ['01001', '11000', '01002'])
+        self.assertEqual(df_pop[age_cols].sum().sum(), 0)
+
+        # partially incomplete data
+        df_pop_raw.loc[7, dd.EngEng['number']] = '7'
+        with self.assertRaises(gpd.gd.DataError):
+            gpd.assign_population_data(
+                df_pop_raw, counties, age_cols, [0, 2, 4, 6])
+
     @patch('memilio.epidata.getPopulationData.read_population_data',
            return_value=df_pop_raw)
     @patch('memilio.epidata.getPopulationData.assign_population_data', return_value=df_pop)
@@ -58,7 +58,8 @@ class TestGetSimulationData(fake_filesystem_unittest.TestCase):
             out_folder=out_folder, no_raw=no_raw, start_date=start_date,
             end_date=end_date, impute_dates=impute_dates,
             moving_average=moving_average, make_plot=make_plot,
-            split_berlin=split_berlin, rep_date=rep_date)
+            split_berlin=split_berlin, rep_date=rep_date,
+            cache_dir='some_cache')
 
         arg_dict_all = {
             "read_data": dd.defaultDict['read_data'],
@@ -71,7 +72,8 @@ class TestGetSimulationData(fake_filesystem_unittest.TestCase):
             "end_date": dd.defaultDict['end_date'],
             "impute_dates": dd.defaultDict['impute_dates'],
             "moving_average": dd.defaultDict['moving_average'],
-            "make_plot": dd.defaultDict['make_plot']}
+            "make_plot": dd.defaultDict['make_plot'],
+            "cache_dir": 'some_cache'}
 
         arg_dict_cases = {
             **arg_dict_all, **arg_dict_data_download,
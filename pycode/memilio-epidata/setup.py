@@ -103,6 +103,10 @@ setup(
             'pylint>=2.13.0,<2.16',
             'pylint_json2html==0.4.0',
         ],
+        # output formats parquet and feather
+        'columnar': [
+            'pyarrow',
+        ],
     },
     cmdclass={
         'pylint': PylintCommand
@@ -23,26 +23,38 @@ import memilio.simulation as mio
 
 
 class Test_ParameterDistribution(unittest.TestCase):
+
+    num_samples = 1000
+
+    @classmethod
+    def setUpClass(cls):
+        # distributions are not modified by the tests, so they are only
+        # constructed once for all tests
+        cls.U = mio.ParameterDistributionUniform(1.0, 2.0)
+        cls.N = mio.ParameterDistributionNormal(-1.0, 1.0, 0.0, 1.0)
+
     def test_uniform(self):
-        U = mio.ParameterDistributionUniform(1.0, 2.0)
         # properties
-        self.assertEqual(U.lower_bound, 1.0)
-        self.assertEqual(U.upper_bound, 2.0)
+        self.assertEqual(self.U.lower_bound, 1.0)
+        self.assertEqual(self.U.upper_bound, 2.0)
         # sample
-        u = U.get_sample()
-        self.assertGreaterEqual(u, 1.0)
-        self.assertLessEqual(u, 2.0)
+        for i in range(self.num_samples):
+            with self.subTest(sample=i):
+                u = self.U.get_sample()
+                self.assertGreaterEqual(u, 1.0)
+                self.assertLessEqual(u, 2.0)
 
     def test_normal(self):
-        N = mio.ParameterDistributionNormal(-1.0, 1.0, 0.0, 1.0)
         # properties
-        self.assertEqual(N.mean, 0.0)  # std_dev automatically adapted
-        self.assertEqual(N.lower_bound, -1.0)
-        self.assertEqual(N.upper_bound, 1.0)
+        self.assertEqual(self.N.mean, 0.0)  # std_dev automatically adapted
+        self.assertEqual(self.N.lower_bound, -1.0)
+        self.assertEqual(self.N.upper_bound, 1.0)
         # sample
-        n = N.get_sample()
-        self.assertGreaterEqual(n, -1)
-        self.assertLessEqual(n, 1)
+        for i in range(self.num_samples):
+            with self.subTest(sample=i):
+                n = self.N.get_sample()
+                self.assertGreaterEqual(n, -1)
+                self.assertLessEqual(n, 1)
 
     def test_polymorphic(self):
         uv = mio.UncertainValue()